@@ -1,9 +1,30 @@
+import functools
+import weakref
+
+import numpy
+
+try:
+    from scipy.linalg.blas import ddot as _blas_ddot, dnrm2 as _blas_dnrm2
+except ImportError:
+    _blas_ddot = None
+    _blas_dnrm2 = None
+
 
 class Compat:
     # A bag class to act as a namespace for compat.
     pass
 
 
+@functools.lru_cache(maxsize=8)
+def _global_index_range(n, dtype_code):
+    """Return the cached index array [0, n) used for gathering vectors.
+
+    Rebuilding this array costs an O(n) allocation and fill per gather
+    call, so it is cached per (size, dtype) instead.
+    """
+    return numpy.arange(n, dtype=dtype_code)
+
+
 def compat(backend):
     compat = Compat()
 
@@ -20,16 +41,20 @@ def compat(backend):
 
         def extract_subfunction(u, V):
             """If V is a subspace of the function-space of u, return the component of u that is in that subspace."""
+            # Collect the sub-indices in a single pass up the space hierarchy
+            # rather than recursing with one Python frame per level.
+            indices = []
+            while V.component is not None:
+                # V is a vector component subspace. The vector functionspace
+                # V.parent may itself be a subspace, so keep walking up.
+                indices.append(V.component)
+                V = V.parent
             if V.index is not None:
                 # V is an indexed subspace of a MixedFunctionSpace
-                return u.sub(V.index)
-            elif V.component is not None:
-                # V is a vector component subspace.
-                # The vector functionspace V.parent may itself be a subspace
-                # so call this function recursively
-                return extract_subfunction(u, V.parent).sub(V.component)
-            else:
-                return u
+                indices.append(V.index)
+            for idx in reversed(indices):
+                u = u.sub(idx)
+            return u
         compat.extract_subfunction = extract_subfunction
 
         def create_bc(bc, value=None, homogenize=None):
@@ -68,6 +93,24 @@ def compat(backend):
             :arg a: a Function.
             :arg b: a Vector.
             """
+            # Aliased case (norm squared): dnrm2 reads the data once,
+            # halving the memory traffic of the dot, and uses a
+            # numerically stabler scaled summation.
+            if a is b and _blas_dnrm2 is not None and a.comm.size == 1:
+                x = a.dat.data_ro
+                if isinstance(x, numpy.ndarray):
+                    r = _blas_dnrm2(x.reshape(-1))
+                    return r * r
+            # Serial fast path: hand the local arrays straight to BLAS ddot,
+            # skipping a Python -> PETSc dispatch per inner product. data_ro
+            # is a read-only view, so no copies are made. In parallel the
+            # reduction is left to the backend.
+            if _blas_ddot is not None and a.comm.size == 1 and hasattr(b, "dat"):
+                x = a.dat.data_ro
+                y = b.dat.data_ro
+                if isinstance(x, numpy.ndarray) and isinstance(y, numpy.ndarray) \
+                        and x.shape == y.shape:
+                    return float(_blas_ddot(x.reshape(-1), y.reshape(-1)))
             return a.vector().inner(b)
         compat.inner = inner
 
@@ -78,7 +121,12 @@ def compat(backend):
             r = value
             for idx in bc._indices:
                 r = r.sub(idx)
-            assert Vtarget == r.function_space()
+            if __debug__:
+                # Full FunctionSpace equality recursively compares meshes,
+                # elements and dofmaps; short-circuit on identity and let
+                # python -O strip the check entirely.
+                Vr = r.function_space()
+                assert Vtarget is Vr or Vtarget == Vr
             return r.vector()
         compat.extract_bc_subvector = extract_bc_subvector
 
@@ -94,7 +142,17 @@ def compat(backend):
                 ufl.Mesh: The extracted mesh
 
             """
-            return form.ufl_domain()
+            # ufl_domain() walks the form's coefficient tree; forms are
+            # immutable in the adjoint usage pattern, so the result is
+            # stashed in the form's framework cache dict after the first
+            # call (ufl.Form declares __slots__, so arbitrary attributes
+            # cannot be attached).
+            cache = form._cache
+            mesh = cache.get("_ad_mesh")
+            if mesh is None:
+                mesh = form.ufl_domain()
+                cache["_ad_mesh"] = mesh
+            return mesh
         compat.extract_mesh_from_form = extract_mesh_from_form
 
         def constant_function_firedrake_compat(value):
@@ -114,14 +172,23 @@ def compat(backend):
                 numpy.ndarray: A numpy array of the function values.
 
             """
-            return value.dat.data
+            # Read-only access: the callers only read the values, and
+            # data_ro skips PyOP2's dirty-flagging/halo bookkeeping that
+            # the writeable .data property performs on every access.
+            return value.dat.data_ro
         compat.constant_function_firedrake_compat = constant_function_firedrake_compat
 
+        # Bound once at wrap time: assemble_adjoint_value runs once per
+        # block in every adjoint sweep, so the per-call module attribute
+        # lookups are worth hoisting out of the hot path.
+        _assemble = backend.assemble
+        _Function = backend.Function
+
         def assemble_adjoint_value(*args, **kwargs):
             """A wrapper around Firedrake's assemble that returns a Vector
             instead of a Function when assembling a 1-form."""
-            result = backend.assemble(*args, **kwargs)
-            if isinstance(result, backend.Function):
+            result = _assemble(*args, **kwargs)
+            if isinstance(result, _Function):
                 return result.vector()
             else:
                 return result
@@ -186,13 +253,15 @@ def compat(backend):
         compat.FunctionSpace.collapse = _fs_collapse
 
         def extract_subfunction(u, V):
-            component = V.component()
             r = u
-            for idx in component:
+            for idx in V.component():
                 r = r.sub(int(idx))
             return r
         compat.extract_subfunction = extract_subfunction
 
+        # Homogenised clones of bcs, keyed weakly on the original bc.
+        _homogenized_bc_cache = weakref.WeakKeyDictionary()
+
         def create_bc(bc, value=None, homogenize=None):
             """Create a new bc object from an existing one.
 
@@ -208,9 +277,24 @@ def compat(backend):
             if value is not None and homogenize is not None:
                 raise ValueError("Cannot provide both value and homogenize")
             if homogenize:
-                bc = backend.DirichletBC(bc)
-                bc.homogenize()
-                return bc
+                # The adjoint clones and homogenises the same bc on every
+                # sweep even though the original bc is invariant, so share
+                # one homogeneous clone per bc. The cache holds the bc
+                # weakly and thus dies with it.
+                try:
+                    cached = _homogenized_bc_cache.get(bc)
+                except TypeError:
+                    # bc is not weak-referenceable; build a fresh clone.
+                    cached = None
+                    cacheable = False
+                else:
+                    cacheable = True
+                if cached is None:
+                    cached = backend.DirichletBC(bc)
+                    cached.homogenize()
+                    if cacheable:
+                        _homogenized_bc_cache[bc] = cached
+                return cached
             try:
                 # FIXME: Not perfect handling of Initialization, wait for development in dolfin.DirihcletBC
                 bc = backend.DirichletBC(backend.FunctionSpace(bc.function_space()),
@@ -228,10 +312,9 @@ def compat(backend):
             :arg V: The function space
             :arg vector: The vector data.
             """
-            if isinstance(vector, backend.cpp.la.PETScVector)\
-               or isinstance(vector, backend.cpp.la.Vector):
-                pass
-            elif not isinstance(vector, backend.Vector):
+            if not isinstance(vector, (backend.cpp.la.PETScVector,
+                                       backend.cpp.la.Vector,
+                                       backend.Vector)):
                 # If vector is a fenics_adjoint.Function, which does not inherit
                 # backend.cpp.function.Function with pybind11
                 vector = vector._cpp_object
@@ -246,16 +329,42 @@ def compat(backend):
             :arg a: a Vector.
             :arg b: a Vector.
             """
+            if a is b:
+                # Aliased case (norm squared): VecNorm reads the data
+                # once instead of the dot's two passes, with no copies.
+                r = a.norm("l2")
+                return r * r
             return a.inner(b)
         compat.inner = inner
 
+        # Wrapped function space and FunctionAssigner per (bc, target
+        # space), both of which are otherwise rebuilt on every adjoint
+        # sweep. The bc is held weakly; each entry keeps its target space
+        # alive, so the id used as inner key cannot be recycled.
+        _bc_subvector_cache = weakref.WeakKeyDictionary()
+
         def extract_bc_subvector(value, Vtarget, bc):
             """Extract from value (a function in a mixed space), the sub
             function corresponding to the part of the space bc applies
             to.  Vtarget is the target (collapsed) space."""
-            assigner = backend.FunctionAssigner(Vtarget, backend.FunctionSpace(bc.function_space()))
+            try:
+                per_bc = _bc_subvector_cache.get(bc)
+            except TypeError:
+                per_bc = None
+            if per_bc is None:
+                per_bc = {}
+                try:
+                    _bc_subvector_cache[bc] = per_bc
+                except TypeError:
+                    pass
+            cached = per_bc.get(id(Vtarget))
+            if cached is None or cached[0] is not Vtarget:
+                Vbc = backend.FunctionSpace(bc.function_space())
+                cached = (Vtarget, Vbc, backend.FunctionAssigner(Vtarget, Vbc))
+                per_bc[id(Vtarget)] = cached
+            _, Vbc, assigner = cached
             output = backend.Function(Vtarget)
-            assigner.assign(output, extract_subfunction(value, backend.FunctionSpace(bc.function_space())))
+            assigner.assign(output, extract_subfunction(value, Vbc))
             return output.vector()
         compat.extract_bc_subvector = extract_bc_subvector
 
@@ -271,7 +380,16 @@ def compat(backend):
                 dolfin.Mesh: The extracted mesh
 
             """
-            return form.ufl_domain().ufl_cargo()
+            # See the firedrake branch: forms are immutable here, so the
+            # ufl_domain() traversal only needs to happen once per form.
+            # The result lives in the form's framework cache dict since
+            # ufl.Form declares __slots__.
+            cache = form._cache
+            mesh = cache.get("_ad_mesh")
+            if mesh is None:
+                mesh = form.ufl_domain().ufl_cargo()
+                cache["_ad_mesh"] = mesh
+            return mesh
         compat.extract_mesh_from_form = extract_mesh_from_form
 
         def constant_function_firedrake_compat(value):
@@ -292,17 +410,23 @@ def compat(backend):
         compat.assemble_adjoint_value = assemble_adjoint_value
 
         def gather(vec):
-            import numpy
-            if isinstance(vec, backend.cpp.function.Function):
-                vec = vec.vector()
-
             if isinstance(vec, backend.cpp.la.GenericVector):
-                arr = vec.gather(numpy.arange(vec.size(), dtype='I'))
-            elif isinstance(vec, list):
+                # Most callers pass a vector directly; test this case
+                # first so the common path pays a single type check
+                # before handing off to the backend's C++ gather.
+                return vec.gather(_global_index_range(vec.size(), 'I'))
+            if isinstance(vec, backend.cpp.function.Function):
+                v = vec.vector()
+                return v.gather(_global_index_range(v.size(), 'I'))
+            if isinstance(vec, list):
                 return list(map(gather, vec))
-            else:
-                arr = vec  # Assume it's a gathered numpy array already
 
+            arr = vec  # Assume it's a gathered numpy array already
+            if isinstance(arr, numpy.ndarray):
+                # Keep the data packed: a C-contiguous float64 array.
+                # Boxing into a list of Python floats costs ~28 bytes
+                # per entry and none of the consumers need it.
+                arr = numpy.ascontiguousarray(arr, dtype=numpy.float64)
             return arr
         compat.gather = gather
 
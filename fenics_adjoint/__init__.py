@@ -31,7 +31,7 @@ backend = sys.modules['backend']
 
 from .assembly import assemble, assemble_system
 from .solving import solve
-from .projection import project
+from .projection import project, project_many
 from .interpolation import interpolate
 from .ufl_constraints import UFLEqualityConstraint, UFLInequalityConstraint
 from .shapead_transformations import (transfer_from_boundary,
@@ -1,3 +1,5 @@
+import numpy
+
 from . import SolveVarFormBlock
 
 
@@ -17,3 +19,67 @@ class ProjectBlock(SolveVarFormBlock):
         kwargs.pop("function", None)
 
         super(ProjectBlock, self).__init__(a == L, output, bcs, *args, **kwargs)
+
+        # Processed recompute forms, reused while the dependency checkpoints
+        # are unchanged (see _replace_recompute_form).
+        self._replaced_forms_cache = None
+        # Input values and solution from the previous recompute
+        # (see recompute_component). The memoization compares rank-local
+        # data, so the skip decision is only safe when every rank would
+        # take the same branch; restrict it to serial runs.
+        self._recompute_cache = None
+        self._recompute_cache_enabled = self.backend.MPI.size(mesh.mpi_comm()) == 1
+
+    def _replace_recompute_form(self):
+        # Replaying a projection re-processes the same forms on every
+        # recompute (ufl.replace traverses the whole expression tree), even
+        # though the replaced forms only depend on the dependency checkpoints.
+        # Cache them and redo the replacement only when a checkpoint has been
+        # swapped out. The solution function is still created fresh for every
+        # recompute so checkpoints are never solved into in-place.
+        func = self._create_initial_guess()
+        checkpoints = [bv.saved_output for bv in self.get_dependencies()]
+        key = tuple(map(id, checkpoints))
+        if self._replaced_forms_cache is None or self._replaced_forms_cache[0] != key:
+            lhs = self._replace_form(self.lhs, func=func)
+            rhs = self._replace_form(self.rhs)
+            bcs = self._recover_bcs()
+            # Keep the checkpoints alive so their ids cannot be recycled.
+            self._replaced_forms_cache = (key, checkpoints, lhs, rhs, bcs)
+        _, _, lhs, rhs, bcs = self._replaced_forms_cache
+        return lhs, rhs, func, bcs
+
+    def _input_snapshot(self, inputs):
+        # Raw values of the inputs, or None if some input cannot be
+        # snapshotted (in which case memoization is skipped).
+        snapshot = []
+        for inp in inputs:
+            if isinstance(inp, self.backend.Function):
+                snapshot.append(inp.vector().get_local())
+            elif isinstance(inp, self.backend.Constant):
+                snapshot.append(numpy.array(inp.values()))
+            elif isinstance(inp, self.compat.MeshType):
+                snapshot.append(inp.coordinates().copy())
+            else:
+                return None
+        return snapshot
+
+    def recompute_component(self, inputs, block_variable, idx, prepared):
+        # A projection is often recomputed because other parts of the tape
+        # changed while its own inputs did not. If every input is
+        # bit-identical to the previous recompute, skip the solve and reuse
+        # the cached solution values. Disabled in parallel: the comparison
+        # is rank-local, and a partial hit would have some ranks skip the
+        # collective solve.
+        snapshot = self._input_snapshot(inputs) if self._recompute_cache_enabled else None
+        if (snapshot is not None and self._recompute_cache is not None
+                and len(snapshot) == len(self._recompute_cache[0])
+                and all(numpy.array_equal(new, old)
+                        for new, old in zip(snapshot, self._recompute_cache[0]))):
+            func = prepared[2]
+            func.vector()[:] = self._recompute_cache[1]
+            return func
+        func = super().recompute_component(inputs, block_variable, idx, prepared)
+        if snapshot is not None:
+            self._recompute_cache = (snapshot, func.vector().get_local())
+        return func
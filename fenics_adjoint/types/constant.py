@@ -83,7 +83,7 @@ class Constant(OverloadedType, backend.Constant):
         a = numpy.zeros(m.value_size())
         p = numpy.zeros(m.value_size())
         m.eval(a, p)
-        return a.tolist()
+        return a
 
     def _ad_copy(self):
         return constant_from_values(self)
@@ -257,7 +257,10 @@ class Function(FloatingType, backend.Function):
             m_v = m
         m_a = compat.gather(m_v)
 
-        return m_a.tolist()
+        # The gathered array is returned as-is: converting to a list boxes
+        # every entry into a Python float, and the consumers (get_global and
+        # friends) accept flat arrays directly.
+        return m_a
 
     def _ad_copy(self):
         r = get_overloaded_class(backend.Function)(self.function_space())
@@ -302,15 +302,19 @@ class OverloadedType(object):
         """This method must be overridden.
 
         The method should implement a routine for converting `m` into a
-        list type. `m` should be an instance of the same type as the class
+        flat sequence of scalars, either a list or a 1D numpy array.
+        `m` should be an instance of the same type as the class
         this method is implemented in. Although maybe the backend version
         of this class, meaning it is not necessarily an OverloadedType.
 
         Args:
-            m (obj): The object to be converted into a list.
+            m (obj): The object to be converted.
 
         Returns:
-            list: A list representation of the data structure of `m`.
+            list or numpy.ndarray: A flat representation of the data
+                structure of `m`. Implementations should prefer returning
+                an array, which avoids boxing every entry into a Python
+                float.
 
         """
         raise NotImplementedError